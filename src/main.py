@@ -12,4 +12,9 @@ load_dotenv()
 from server import main
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # Not installed on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
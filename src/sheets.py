@@ -7,15 +7,34 @@ Read and manage Google Sheets via the Sheets REST API v4.
 Ref: https://developers.google.com/sheets/api/guides/concepts
 """
 
+import asyncio
+import functools
 import json
+import os
+import re
+import time
+from collections.abc import Iterable
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from _uri import encode_range as _encode_range_fast
+    from _uri import ranges_param as _ranges_param_fast
+except ImportError:  # pragma: no cover - compiled extension not built
+    _encode_range_fast = None
+    _ranges_param_fast = None
+
 from mcp.types import TextContent, Tool
 
 from dedalus_mcp.types import ToolAnnotations
 
-from dedalus_mcp import HttpMethod, HttpRequest, get_context, tool
+from dedalus_mcp import DispatchResponse, HttpMethod, HttpRequest, get_context, tool
 from dedalus_mcp.auth import Connection, SecretKeys
 
 # -----------------------------------------------------------------------------
@@ -33,25 +52,327 @@ sheets = Connection(
 # Helpers
 # -----------------------------------------------------------------------------
 
+# Kept a list: dedalus_mcp's normalize_tool_result reads any 2-tuple as (content, structured).
 SheetsResult = list[TextContent]
 
+# Compact JSON by default; set SHEETS_PRETTY_JSON=1 for indented output when debugging.
+_PRETTY_JSON = os.getenv("SHEETS_PRETTY_JSON", "").lower() in ("1", "true", "yes")
 
-async def _req(method: HttpMethod, path: str, body: dict | None = None) -> SheetsResult:
-    """Make a Sheets API request and return JSON as TextContent."""
+
+def _dumps(data: Any) -> str:
+    """Serialize a payload to JSON text, preferring orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if _PRETTY_JSON:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+async def _send(method: HttpMethod, path: str, body: dict | None = None) -> DispatchResponse:
+    """Dispatch a Sheets API request through the caller's connection."""
     ctx = get_context()
-    resp = await ctx.dispatch("google-sheets-mcp", HttpRequest(method=method, path=path, body=body))
+    return await ctx.dispatch("google-sheets-mcp", HttpRequest(method=method, path=path, body=body))
+
+
+def _ok(resp: DispatchResponse) -> bool:
+    """Whether the request reached Sheets and got a non-error status."""
+    return resp.success and resp.response is not None and resp.response.status < 400
+
+
+# Same output as _dumps({"error": message}) without building and walking a dict.
+_ERROR_TEMPLATE = '{\n  "error": %s\n}' if _PRETTY_JSON else '{"error":%s}'
+
+
+def _text(text: str) -> SheetsResult:
+    """Wrap text as a single-block result. Inputs are always str, so pydantic validation is skipped."""
+    return [TextContent.model_construct(type="text", text=text)]
+
+
+def _error(message: str) -> SheetsResult:
+    """Render an error message as JSON TextContent."""
+    return _text(_ERROR_TEMPLATE % _dumps(message))
+
+
+def _to_result(resp: DispatchResponse) -> SheetsResult:
+    """Render a dispatch response as TextContent.
+
+    JSON bodies are re-serialized. Non-JSON text bodies are passed through as-is on
+    success; with an error status they are wrapped in the ``{"error": ...}`` envelope
+    so error output always has the same JSON shape.
+    """
     if resp.success:
-        data = resp.response.body or {}
-        return [TextContent(type="text", text=json.dumps(data, indent=2))]
-    error = resp.error.message if resp.error else "Request failed"
-    return [TextContent(type="text", text=json.dumps({"error": error}, indent=2))]
+        data = resp.response.body
+        if isinstance(data, str) and data:
+            if resp.response.status >= 400:
+                return _error(f"HTTP {resp.response.status}: {data}")
+            return _text(data)
+        return _text(_dumps(data or {}))
+    return _error(resp.error.message if resp.error else "Request failed")
+
+
+async def _req(method: HttpMethod, path: str, body: dict | None = None) -> SheetsResult:
+    """Make a Sheets API request and return the response as TextContent (JSON, or raw text for non-JSON bodies)."""
+    return _to_result(await _send(method, path, body))
+
+
+def _caller() -> str | None:
+    """Return the caller's connection handle, or None if it cannot be determined."""
+    claims = getattr(get_context().auth_context, "claims", None)
+    connections = claims.get("ddls:connections") if isinstance(claims, dict) else None
+    return connections.get("google-sheets-mcp") if isinstance(connections, dict) else None
+
+
+class _MetaCache:
+    """TTL cache for read-only spreadsheet metadata.
+
+    Keys are ``(caller, spreadsheet_id, ...)`` so one user's results are never
+    served to another. Spreadsheets with reads in flight also have a generation
+    counter, bumped on every write, so a read that overlapped a write is not
+    stored. Counters are dropped once their last read finishes, so they are
+    bounded by live requests rather than by every spreadsheet ever written.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: dict[tuple, tuple[float, SheetsResult]] = {}
+        # spreadsheet_id -> [reads in flight, generation]
+        self._inflight: dict[str, list[int]] = {}
+
+    def begin_read(self, spreadsheet_id: str) -> int:
+        """Register an in-flight read and return the generation to pass to end_read."""
+        entry = self._inflight.get(spreadsheet_id)
+        if entry is None:
+            entry = self._inflight[spreadsheet_id] = [0, 0]
+        entry[0] += 1
+        return entry[1]
+
+    def end_read(self, spreadsheet_id: str, generation: int) -> bool:
+        """Unregister a read; True if no write happened since its begin_read."""
+        entry = self._inflight[spreadsheet_id]
+        entry[0] -= 1
+        if entry[0] == 0:
+            del self._inflight[spreadsheet_id]
+        return entry[1] == generation
+
+    def get(self, key: tuple) -> SheetsResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        return result
+
+    def put(self, key: tuple, result: SheetsResult) -> None:
+        if self._ttl <= 0:
+            return
+        now = time.monotonic()
+        if len(self._entries) >= self._maxsize:
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+            while len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + self._ttl, result)
+
+    def invalidate(self, spreadsheet_id: str) -> None:
+        entry = self._inflight.get(spreadsheet_id)
+        if entry is not None:
+            entry[1] += 1
+        for key in [k for k in self._entries if k[1] == spreadsheet_id]:
+            del self._entries[key]
+
+
+_meta_cache = _MetaCache(ttl=float(os.getenv("SHEETS_META_TTL", "60")))
+
+
+async def _cached_get(key: tuple, path: str) -> SheetsResult:
+    """GET ``path``, serving and storing successful responses in the metadata cache."""
+    caller = _caller()
+    if caller is None:
+        return await _req(HttpMethod.GET, path)
+    key = (caller, *key)
+    cached = _meta_cache.get(key)
+    if cached is not None:
+        return cached
+    generation = _meta_cache.begin_read(key[1])
+    try:
+        resp = await _send(HttpMethod.GET, path)
+    finally:
+        unchanged = _meta_cache.end_read(key[1], generation)
+    result = _to_result(resp)
+    if _ok(resp) and unchanged:
+        _meta_cache.put(key, result)
+    return result
+
+
+async def _write(spreadsheet_id: str, method: HttpMethod, path: str, body: dict | None = None) -> SheetsResult:
+    """Make a mutating request and drop cached metadata for the spreadsheet."""
+    try:
+        return await _req(method, path, body)
+    finally:
+        _meta_cache.invalidate(spreadsheet_id)
+
+
+_BOOL = MappingProxyType({True: "true", False: "false"})
+
+
+def _flag(value: Any) -> str:
+    """Format a boolean query param.
+
+    Tool arguments arrive without schema coercion, so anything other than a real
+    bool (e.g. the string "true") falls back to ``str(value).lower()``.
+    """
+    if value is True or value is False:
+        return _BOOL[value]
+    return str(value).lower()
+
+
+# How long the first concurrent sheets_get_values call waits for others to merge into one batchGet (0 disables).
+_COALESCE_WINDOW = float(os.getenv("SHEETS_COALESCE_MS", "5")) / 1000
+
+# (caller, spreadsheet_id, query_string) -> follower reads waiting on the leader's batchGet
+_pending_reads: dict[tuple, list[tuple[str, asyncio.Future]]] = {}
+
+# Query strings for the default option values, which nearly every call uses.
+_DEFAULT_RENDER = ("ROWS", "FORMATTED_VALUE", "SERIAL_NUMBER")
+_DEFAULT_GET_QS = "majorDimension=ROWS&valueRenderOption=FORMATTED_VALUE&dateTimeRenderOption=SERIAL_NUMBER"
+_DEFAULT_UPDATE_QS = "valueInputOption=USER_ENTERED&includeValuesInResponse=false"
+_DEFAULT_APPEND_QS = "valueInputOption=USER_ENTERED&insertDataOption=INSERT_ROWS&includeValuesInResponse=false"
+_LIST_SHEETS_QS = "fields=spreadsheetId,properties(title),sheets(properties(sheetId,title,index,gridProperties))"
+
+
+# A1 notation: a sheet name (quoted or bare), optionally followed by "!" and a cell range.
+# A bare string may also be a named range or plain cell range, so only the part after "!"
+# is checked strictly; anything tighter would reject input Sheets accepts.
+# In the comma-separated form, bare names cannot start or end with whitespace so each
+# token has exactly one parse (avoids catastrophic backtracking on long inputs), and
+# no name may contain "," or "&": _ranges_param splits on every comma, and HttpRequest
+# treats "&" in the query as a parameter separator.
+_A1_CELL = r"(?:\$?[A-Za-z]{1,3}\$?\d*|\$?\d+|[Rr]\d*[Cc]\d*)"
+_A1_CELLS = rf"(?:!{_A1_CELL}(?::{_A1_CELL})?)?"
+_A1_QUOTED = r"'(?:[^']|'')+'"
+_A1_RANGE = re.compile(rf"(?:{_A1_QUOTED}|(?!')[^!]+){_A1_CELLS}")
+_A1_TOKEN = rf"(?:'(?:[^',&]|'')+'|[^'!,&\s](?:[^!,&]*[^!,&\s])?){_A1_CELLS}"
+_A1_RANGE_LIST = re.compile(rf"\s*(?:{_A1_TOKEN}\s*)?(?:,\s*(?:{_A1_TOKEN}\s*)?)*")
+
+
+def _invalid_range(range_a1: str) -> SheetsResult | None:
+    """Return an error result if ``range_a1`` is not valid A1 notation."""
+    if _A1_RANGE.fullmatch(range_a1):
+        return None
+    return _error(f"Invalid A1 range: {range_a1!r}")
+
+
+def _invalid_ranges(ranges: str) -> SheetsResult | None:
+    """Return an error result if comma-separated ``ranges`` contains invalid A1 notation."""
+    if _A1_RANGE_LIST.fullmatch(ranges):
+        return None
+    bad = next((r.strip() for r in ranges.split(",") if r.strip() and not _A1_RANGE.fullmatch(r.strip())), ranges)
+    return _error(f"Invalid A1 range: {bad!r} (listed sheet names cannot contain ',' or '&')")
+
+
+@functools.lru_cache(maxsize=256)
+def _sheet_prefix(spreadsheet_id: str) -> str:
+    """Return the API path prefix for a spreadsheet."""
+    return f"/v4/spreadsheets/{spreadsheet_id}"
+
+
+@functools.lru_cache(maxsize=256)
+def _values_prefix(spreadsheet_id: str) -> str:
+    """Return the single-range values path prefix for a spreadsheet."""
+    return f"{_sheet_prefix(spreadsheet_id)}/values/"
+
+
+def _query(pairs: Iterable[tuple[str, str]]) -> str:
+    """Join query parameters. Values stay raw: HttpRequest percent-encodes the query itself."""
+    return "&".join([f"{key}={value}" for key, value in pairs])
+
+
+def _render_query(major_dimension: str, value_render_option: str, date_time_render_option: str) -> str:
+    """Build the values read query string, reusing the precomputed one for the defaults."""
+    if (major_dimension, value_render_option, date_time_render_option) == _DEFAULT_RENDER:
+        return _DEFAULT_GET_QS
+    return (
+        f"majorDimension={major_dimension}"
+        f"&valueRenderOption={value_render_option}"
+        f"&dateTimeRenderOption={date_time_render_option}"
+    )
 
 
+def _ranges_param(ranges: str) -> str:
+    """Turn comma-separated A1 ranges into ``&ranges=...`` query params, dropping empty entries."""
+    if _ranges_param_fast is not None:
+        return _ranges_param_fast(ranges)
+    return "".join([f"&ranges={r}" for r in (r.strip() for r in ranges.split(",")) if r])
+
+
+@functools.lru_cache(maxsize=1024)
 def _encode_range(range_a1: str) -> str:
     """URL-encode an A1 notation range, preserving safe characters."""
+    if _encode_range_fast is not None:
+        return _encode_range_fast(range_a1)
     return quote(range_a1, safe="!:$'(),-._~")
 
 
+async def _batch_get_values(spreadsheet_id: str, ranges: str, query_string: str) -> SheetsResult:
+    """Read comma-separated ``ranges`` in one batchGet. Callers validate ``ranges`` first."""
+    return await _req(
+        HttpMethod.GET,
+        f"{_sheet_prefix(spreadsheet_id)}/values:batchGet?{query_string}{_ranges_param(ranges)}",
+    )
+
+
+async def _batch_get_ranges(spreadsheet_id: str, ranges: list[str], query_string: str) -> list[SheetsResult] | None:
+    """Fetch several ranges in one batchGet, returning one result per range or None on failure."""
+    path = f"{_sheet_prefix(spreadsheet_id)}/values:batchGet?{query_string}&{_query(('ranges', r) for r in ranges)}"
+    resp = await _send(HttpMethod.GET, path)
+    if not _ok(resp) or not isinstance(resp.response.body, dict):
+        return None
+    value_ranges = resp.response.body.get("valueRanges")
+    if not isinstance(value_ranges, list) or len(value_ranges) != len(ranges):
+        return None
+    return [_text(_dumps(vr)) for vr in value_ranges]
+
+
+async def _get_values(spreadsheet_id: str, range_a1: str, query_string: str) -> SheetsResult:
+    """Read one range, merging concurrent reads of the same spreadsheet into a single batchGet.
+
+    The first caller for a key leads: it waits ``_COALESCE_WINDOW`` for others to
+    join, then issues the batchGet in its own request context. Batches are keyed
+    by caller, so requests never run under another user's connection. If the
+    batch fails, every caller falls back to its own values.get.
+    """
+    path = f"{_values_prefix(spreadsheet_id)}{_encode_range(range_a1)}?{query_string}"
+    caller = _caller() if _COALESCE_WINDOW > 0 and "&" not in range_a1 else None
+    if caller is None:
+        return await _req(HttpMethod.GET, path)
+
+    key = (caller, spreadsheet_id, query_string)
+    batch = _pending_reads.get(key)
+    if batch is not None:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        batch.append((range_a1, future))
+        result = await future
+        return result if result is not None else await _req(HttpMethod.GET, path)
+
+    batch = _pending_reads[key] = []
+    results: list[SheetsResult] | None = None
+    try:
+        await asyncio.sleep(_COALESCE_WINDOW)
+        del _pending_reads[key]
+        if batch:
+            results = await _batch_get_ranges(spreadsheet_id, [range_a1, *(r for r, _ in batch)], query_string)
+    finally:
+        if _pending_reads.get(key) is batch:
+            del _pending_reads[key]
+        for i, (_, future) in enumerate(batch, start=1):
+            if not future.done():
+                future.set_result(results[i] if results else None)
+    return results[0] if results else await _req(HttpMethod.GET, path)
+
+
 # -----------------------------------------------------------------------------
 # Spreadsheet Tools
 # -----------------------------------------------------------------------------
@@ -69,15 +390,21 @@ async def sheets_get_spreadsheet(
     fields: str = "",
 ) -> SheetsResult:
     """Get spreadsheet metadata. Optionally include grid data for specific ranges."""
-    params = [f"includeGridData={str(include_grid_data).lower()}"]
-    if ranges:
-        for r in ranges.split(","):
-            params.append(f"ranges={r.strip()}")
+    if ranges and (error := _invalid_ranges(ranges)):
+        return error
+    include_grid_data = _flag(include_grid_data) == "true"
+    pairs = [("includeGridData", _BOOL[include_grid_data])]
     if fields:
-        params.append(f"fields={fields}")
+        pairs.append(("fields", fields))
 
-    query_string = "&".join(params)
-    return await _req(HttpMethod.GET, f"/v4/spreadsheets/{spreadsheet_id}?{query_string}")
+    query_string = _query(pairs)
+    if ranges:
+        query_string += _ranges_param(ranges)
+    path = f"{_sheet_prefix(spreadsheet_id)}?{query_string}"
+    if include_grid_data:
+        # Grid data is cell values, not metadata: potentially large and edited outside this server.
+        return await _req(HttpMethod.GET, path)
+    return await _cached_get((spreadsheet_id, ranges, fields), path)
 
 
 @tool(
@@ -87,10 +414,9 @@ async def sheets_get_spreadsheet(
 )
 async def sheets_list_sheets(spreadsheet_id: str) -> SheetsResult:
     """List sheets/tabs with compact metadata."""
-    fields = "spreadsheetId,properties(title),sheets(properties(sheetId,title,index,gridProperties))"
-    return await _req(
-        HttpMethod.GET,
-        f"/v4/spreadsheets/{spreadsheet_id}?fields={fields}",
+    return await _cached_get(
+        (spreadsheet_id, "list_sheets"),
+        f"{_sheet_prefix(spreadsheet_id)}?{_LIST_SHEETS_QS}",
     )
 
 
@@ -112,17 +438,10 @@ async def sheets_get_values(
     date_time_render_option: str = "SERIAL_NUMBER",
 ) -> SheetsResult:
     """Get values from a range. Returns 2D array of cell values."""
-    encoded_range = _encode_range(range)
-    params = [
-        f"majorDimension={major_dimension}",
-        f"valueRenderOption={value_render_option}",
-        f"dateTimeRenderOption={date_time_render_option}",
-    ]
-    query_string = "&".join(params)
-    return await _req(
-        HttpMethod.GET,
-        f"/v4/spreadsheets/{spreadsheet_id}/values/{encoded_range}?{query_string}",
-    )
+    if error := _invalid_range(range):
+        return error
+    query_string = _render_query(major_dimension, value_render_option, date_time_render_option)
+    return await _get_values(spreadsheet_id, range, query_string)
 
 
 @tool(
@@ -138,19 +457,36 @@ async def sheets_batch_get_values(
     date_time_render_option: str = "SERIAL_NUMBER",
 ) -> SheetsResult:
     """Get values from multiple ranges. Ranges should be comma-separated A1 notation."""
-    params = [
-        f"majorDimension={major_dimension}",
-        f"valueRenderOption={value_render_option}",
-        f"dateTimeRenderOption={date_time_render_option}",
-    ]
-    for r in ranges.split(","):
-        params.append(f"ranges={r.strip()}")
-
-    query_string = "&".join(params)
-    return await _req(
-        HttpMethod.GET,
-        f"/v4/spreadsheets/{spreadsheet_id}/values:batchGet?{query_string}",
+    if error := _invalid_ranges(ranges):
+        return error
+    query_string = _render_query(major_dimension, value_render_option, date_time_render_option)
+    return await _batch_get_values(spreadsheet_id, ranges, query_string)
+
+
+@tool(
+    description=(
+        "Open a spreadsheet in one step: list its sheets and read values from ranges concurrently. "
+        "Faster than sheets_list_sheets followed by sheets_batch_get_values."
+    ),
+    tags=["spreadsheet", "values", "read"],
+    annotations=ToolAnnotations(readOnlyHint=True),
+)
+async def sheets_prime(
+    spreadsheet_id: str,
+    ranges: str,
+    major_dimension: str = "ROWS",
+    value_render_option: str = "FORMATTED_VALUE",
+    date_time_render_option: str = "SERIAL_NUMBER",
+) -> SheetsResult:
+    """List sheets and get values from comma-separated A1 ranges. Returns both results."""
+    if error := _invalid_ranges(ranges):
+        return error
+    query_string = _render_query(major_dimension, value_render_option, date_time_render_option)
+    sheets_result, values_result = await asyncio.gather(
+        sheets_list_sheets(spreadsheet_id),
+        _batch_get_values(spreadsheet_id, ranges, query_string),
     )
+    return [*sheets_result, *values_result]
 
 
 # -----------------------------------------------------------------------------
@@ -171,16 +507,24 @@ async def sheets_update_values(
     include_values_in_response: bool = False,
 ) -> SheetsResult:
     """Update values in a range. Values is a 2D array matching the range dimensions."""
+    if error := _invalid_range(range):
+        return error
     encoded_range = _encode_range(range)
-    params = [
-        f"valueInputOption={value_input_option}",
-        f"includeValuesInResponse={str(include_values_in_response).lower()}",
-    ]
-    query_string = "&".join(params)
+    include_values = _flag(include_values_in_response)
+    if value_input_option == "USER_ENTERED" and include_values == "false":
+        query_string = _DEFAULT_UPDATE_QS
+    else:
+        query_string = _query(
+            (
+                ("valueInputOption", value_input_option),
+                ("includeValuesInResponse", include_values),
+            )
+        )
     body = {"values": values}
-    return await _req(
+    return await _write(
+        spreadsheet_id,
         HttpMethod.PUT,
-        f"/v4/spreadsheets/{spreadsheet_id}/values/{encoded_range}?{query_string}",
+        f"{_values_prefix(spreadsheet_id)}{encoded_range}?{query_string}",
         body,
     )
 
@@ -202,9 +546,10 @@ async def sheets_batch_update_values(
         "includeValuesInResponse": include_values_in_response,
         "data": data,
     }
-    return await _req(
+    return await _write(
+        spreadsheet_id,
         HttpMethod.POST,
-        f"/v4/spreadsheets/{spreadsheet_id}/values:batchUpdate",
+        f"{_sheet_prefix(spreadsheet_id)}/values:batchUpdate",
         body,
     )
 
@@ -223,17 +568,25 @@ async def sheets_append_values(
     include_values_in_response: bool = False,
 ) -> SheetsResult:
     """Append values after existing data. INSERT_ROWS adds new rows, OVERWRITE overwrites."""
+    if error := _invalid_range(range):
+        return error
     encoded_range = _encode_range(range)
-    params = [
-        f"valueInputOption={value_input_option}",
-        f"insertDataOption={insert_data_option}",
-        f"includeValuesInResponse={str(include_values_in_response).lower()}",
-    ]
-    query_string = "&".join(params)
+    include_values = _flag(include_values_in_response)
+    if value_input_option == "USER_ENTERED" and insert_data_option == "INSERT_ROWS" and include_values == "false":
+        query_string = _DEFAULT_APPEND_QS
+    else:
+        query_string = _query(
+            (
+                ("valueInputOption", value_input_option),
+                ("insertDataOption", insert_data_option),
+                ("includeValuesInResponse", include_values),
+            )
+        )
     body = {"values": values}
-    return await _req(
+    return await _write(
+        spreadsheet_id,
         HttpMethod.POST,
-        f"/v4/spreadsheets/{spreadsheet_id}/values/{encoded_range}:append?{query_string}",
+        f"{_values_prefix(spreadsheet_id)}{encoded_range}:append?{query_string}",
         body,
     )
 
@@ -248,10 +601,13 @@ async def sheets_clear_values(
     range: str,
 ) -> SheetsResult:
     """Clear values from a range. Formatting is preserved."""
+    if error := _invalid_range(range):
+        return error
     encoded_range = _encode_range(range)
-    return await _req(
+    return await _write(
+        spreadsheet_id,
         HttpMethod.POST,
-        f"/v4/spreadsheets/{spreadsheet_id}/values/{encoded_range}:clear",
+        f"{_values_prefix(spreadsheet_id)}{encoded_range}:clear",
         {},
     )
 
@@ -276,9 +632,10 @@ async def sheets_batch_update(
         "requests": requests,
         "includeSpreadsheetInResponse": include_spreadsheet_in_response,
     }
-    return await _req(
+    return await _write(
+        spreadsheet_id,
         HttpMethod.POST,
-        f"/v4/spreadsheets/{spreadsheet_id}:batchUpdate",
+        f"{_sheet_prefix(spreadsheet_id)}:batchUpdate",
         body,
     )
 
@@ -310,7 +667,7 @@ async def sheets_create(
 # Export
 # -----------------------------------------------------------------------------
 
-sheets_tools: list[Tool] = [
+sheets_tools: tuple[Tool, ...] = (
     # Spreadsheet
     sheets_get_spreadsheet,
     sheets_list_sheets,
@@ -319,9 +676,10 @@ sheets_tools: list[Tool] = [
     # Values (Read)
     sheets_get_values,
     sheets_batch_get_values,
+    sheets_prime,
     # Values (Write)
     sheets_update_values,
     sheets_batch_update_values,
     sheets_append_values,
     sheets_clear_values,
-]
+)
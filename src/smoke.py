@@ -33,4 +33,4 @@ async def smoke_info() -> list[TextContent]:
     ]
 
 
-smoke_tools: list[Tool] = [smoke_echo, smoke_info]
+smoke_tools: tuple[Tool, ...] = (smoke_echo, smoke_info)
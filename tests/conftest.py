@@ -0,0 +1,71 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Shared fixtures: a fake request context whose dispatch records requests."""
+
+import asyncio
+from collections.abc import Callable
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import unquote
+
+import pytest
+from dedalus_mcp import DispatchResponse, HttpRequest, HttpResponse
+
+import sheets
+
+Handler = Callable[[HttpRequest], tuple[int, Any]]
+
+_current: ContextVar["FakeContext"] = ContextVar("current_context")
+
+
+def batch_ranges(request: HttpRequest) -> list[str]:
+    """Return the decoded ``ranges`` params of a request path."""
+    query = request.path.split("?", 1)[1]
+    return [unquote(p[len("ranges=") :]) for p in query.split("&") if p.startswith("ranges=")]
+
+
+def echo_values(request: HttpRequest) -> tuple[int, Any]:
+    """Answer values reads with a ValueRange per requested range."""
+    if "values:batchGet" in request.path:
+        return 200, {"valueRanges": [{"range": r, "values": [[r]]} for r in batch_ranges(request)]}
+    encoded = request.path.split("/values/", 1)[1].split("?", 1)[0]
+    return 200, {"range": unquote(encoded), "values": [["single"]]}
+
+
+class FakeContext:
+    """Stand-in for dedalus_mcp's Context: fixed caller claims and a scripted dispatch."""
+
+    def __init__(
+        self,
+        handle: str | None = "ddls:conn:alice",
+        handler: Handler = echo_values,
+        latency: dict[str, int] | None = None,
+    ) -> None:
+        claims = {"ddls:connections": {"google-sheets-mcp": handle}} if handle else {}
+        self.auth_context = SimpleNamespace(claims=claims)
+        self.handle = handle
+        self.handler = handler
+        self.latency = latency or {}
+        self.requests: list[HttpRequest] = []
+
+    async def dispatch(self, target: str, request: HttpRequest) -> DispatchResponse:
+        self.requests.append(request)
+        # The upstream answers on receipt; the response then takes `latency` loop turns to arrive.
+        status, body = self.handler(request)
+        for _ in range(self.latency.get(request.method, 1)):
+            await asyncio.sleep(0)
+        return DispatchResponse.ok(HttpResponse(status=status, body=body))
+
+    async def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a tool as this caller (each asyncio task gets its own context)."""
+        _current.set(self)
+        return await fn(*args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sheets, "get_context", _current.get)
+    monkeypatch.setattr(sheets, "_meta_cache", sheets._MetaCache(ttl=60))
+    sheets._pending_reads.clear()
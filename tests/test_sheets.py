@@ -0,0 +1,292 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Tests for the Sheets tool helpers: coalescing, caching, rendering, validation and URI encoding."""
+
+import asyncio
+import json
+import random
+from urllib.parse import quote
+
+import pytest
+from conftest import FakeContext, batch_ranges, echo_values
+
+import sheets
+
+# -----------------------------------------------------------------------------
+# Read coalescing
+# -----------------------------------------------------------------------------
+
+
+async def test_single_read_uses_values_get() -> None:
+    ctx = FakeContext()
+    await ctx.call(sheets.sheets_get_values, "S", "A1")
+
+    assert len(ctx.requests) == 1
+    assert "/values/A1?" in ctx.requests[0].path
+
+
+async def test_concurrent_reads_coalesce_into_one_batch_get() -> None:
+    ctx = FakeContext()
+    ranges = ["A1", "Sheet1!B2:C3", "'My Sheet'!D4"]
+    results = await asyncio.gather(*(ctx.call(sheets.sheets_get_values, "S", r) for r in ranges))
+
+    assert len(ctx.requests) == 1
+    assert "values:batchGet" in ctx.requests[0].path
+    assert batch_ranges(ctx.requests[0]) == ranges
+    assert [json.loads(r[0].text)["range"] for r in results] == ranges
+
+
+async def test_different_connections_never_share_a_batch() -> None:
+    alice = FakeContext("ddls:conn:alice")
+    bob = FakeContext("ddls:conn:bob")
+    results = await asyncio.gather(
+        alice.call(sheets.sheets_get_values, "S", "A1"),
+        bob.call(sheets.sheets_get_values, "S", "B1"),
+        alice.call(sheets.sheets_get_values, "S", "A2"),
+        bob.call(sheets.sheets_get_values, "S", "B2"),
+    )
+
+    assert [batch_ranges(r) for r in alice.requests] == [["A1", "A2"]]
+    assert [batch_ranges(r) for r in bob.requests] == [["B1", "B2"]]
+    assert [json.loads(r[0].text)["range"] for r in results] == ["A1", "B1", "A2", "B2"]
+
+
+async def test_batch_error_falls_back_to_values_get() -> None:
+    def handler(request):
+        if "values:batchGet" in request.path:
+            return 400, {"error": {"code": 400, "message": "Unable to parse range"}}
+        return 200, {"values": [["single"]]}
+
+    ctx = FakeContext(handler=handler)
+    results = await asyncio.gather(*(ctx.call(sheets.sheets_get_values, "S", r) for r in ["A1", "B1", "C1"]))
+
+    assert ["values:batchGet" in r.path for r in ctx.requests] == [True, False, False, False]
+    assert all(json.loads(r[0].text) == {"values": [["single"]]} for r in results)
+
+
+async def test_cancelled_leader_lets_followers_resolve() -> None:
+    ctx = FakeContext()
+    leader = asyncio.create_task(ctx.call(sheets.sheets_get_values, "S", "A1"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(ctx.call(sheets.sheets_get_values, "S", "B1"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    result = await follower
+
+    assert json.loads(result[0].text)["range"] == "B1"
+    assert sheets._pending_reads == {}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+# -----------------------------------------------------------------------------
+# Metadata cache
+# -----------------------------------------------------------------------------
+
+
+def _versioned():
+    state = {"version": 1}
+
+    def handler(request):
+        if request.method != "GET":
+            state["version"] += 1
+            return 200, {}
+        return 200, {"version": state["version"]}
+
+    return handler
+
+
+async def test_metadata_cache_hit() -> None:
+    ctx = FakeContext(handler=_versioned())
+    first = await ctx.call(sheets.sheets_list_sheets, "S")
+    second = await ctx.call(sheets.sheets_list_sheets, "S")
+
+    assert len(ctx.requests) == 1
+    assert second == first
+
+
+async def test_metadata_cache_is_per_caller() -> None:
+    alice = FakeContext("ddls:conn:alice", handler=_versioned())
+    bob = FakeContext("ddls:conn:bob", handler=_versioned())
+    await alice.call(sheets.sheets_list_sheets, "S")
+    await bob.call(sheets.sheets_list_sheets, "S")
+
+    assert len(alice.requests) == 1
+    assert len(bob.requests) == 1
+
+
+async def test_write_invalidates_metadata_cache() -> None:
+    ctx = FakeContext(handler=_versioned())
+    await ctx.call(sheets.sheets_list_sheets, "S")
+    await ctx.call(sheets.sheets_batch_update, "S", [])
+    result = await ctx.call(sheets.sheets_list_sheets, "S")
+
+    assert json.loads(result[0].text) == {"version": 2}
+    assert len(ctx.requests) == 3
+    assert sheets._meta_cache._inflight == {}
+
+
+async def test_read_racing_a_write_is_not_cached() -> None:
+    # The GET is answered before the write lands but its response arrives after the invalidation.
+    ctx = FakeContext(handler=_versioned(), latency={"GET": 3})
+    await asyncio.gather(
+        ctx.call(sheets.sheets_list_sheets, "S"),
+        ctx.call(sheets.sheets_batch_update, "S", []),
+    )
+    result = await ctx.call(sheets.sheets_list_sheets, "S")
+
+    assert json.loads(result[0].text) == {"version": 2}
+    assert sheets._meta_cache._inflight == {}
+
+
+async def test_no_caching_without_caller_handle() -> None:
+    ctx = FakeContext(handle=None, handler=_versioned())
+    await ctx.call(sheets.sheets_list_sheets, "S")
+    await ctx.call(sheets.sheets_list_sheets, "S")
+
+    assert len(ctx.requests) == 2
+
+
+async def test_grid_data_is_not_cached() -> None:
+    ctx = FakeContext(handler=_versioned())
+    await ctx.call(sheets.sheets_get_spreadsheet, "S", include_grid_data=True)
+    await ctx.call(sheets.sheets_get_spreadsheet, "S", include_grid_data="true")
+
+    assert len(ctx.requests) == 2
+    assert all("includeGridData=true" in r.path for r in ctx.requests)
+
+
+async def test_error_responses_are_not_cached() -> None:
+    ctx = FakeContext(handler=lambda request: (404, {"error": {"code": 404}}))
+    await ctx.call(sheets.sheets_list_sheets, "S")
+    await ctx.call(sheets.sheets_list_sheets, "S")
+
+    assert len(ctx.requests) == 2
+
+
+async def test_prime_reads_metadata_and_values_concurrently() -> None:
+    def handler(request):
+        if "values:batchGet" in request.path:
+            return echo_values(request)
+        return 200, {"sheets": [{"properties": {"title": "Sheet1"}}]}
+
+    ctx = FakeContext(handler=handler)
+    first = await ctx.call(sheets.sheets_prime, "S", "A1, Sheet1!B2")
+
+    assert len(ctx.requests) == 2
+    assert ["values:batchGet" in r.path for r in ctx.requests].count(True) == 1
+    assert batch_ranges(next(r for r in ctx.requests if "values:batchGet" in r.path)) == ["A1", "Sheet1!B2"]
+    assert len(first) == 2
+    assert json.loads(first[0].text) == {"sheets": [{"properties": {"title": "Sheet1"}}]}
+    assert [vr["range"] for vr in json.loads(first[1].text)["valueRanges"]] == ["A1", "Sheet1!B2"]
+
+    second = await ctx.call(sheets.sheets_prime, "S", "A1")
+
+    assert len(ctx.requests) == 3
+    assert "values:batchGet" in ctx.requests[2].path
+    assert second[0] == first[0]
+
+
+# -----------------------------------------------------------------------------
+# Response rendering
+# -----------------------------------------------------------------------------
+
+
+async def test_text_body_passes_through_on_success() -> None:
+    ctx = FakeContext(handler=lambda request: (200, "a,b\n1,2"))
+    result = await ctx.call(sheets.sheets_create, "T")
+
+    assert result[0].text == "a,b\n1,2"
+
+
+async def test_text_body_is_wrapped_on_error_status() -> None:
+    ctx = FakeContext(handler=lambda request: (502, "<html>Bad Gateway</html>"))
+    result = await ctx.call(sheets.sheets_create, "T")
+
+    assert json.loads(result[0].text) == {"error": "HTTP 502: <html>Bad Gateway</html>"}
+
+
+@pytest.mark.parametrize("message", ["Request failed", 'quote " and \\ backslash', "naïve 中文 😀", "line\nbreak"])
+def test_error_matches_dumps(message: str) -> None:
+    assert sheets._error(message)[0].text == sheets._dumps({"error": message})
+
+
+# -----------------------------------------------------------------------------
+# A1 validation
+# -----------------------------------------------------------------------------
+
+VALID = [
+    "Sheet1",
+    "Sheet1!A1",
+    "Sheet1!A1:B2",
+    "A1:B2",
+    "A:A",
+    "1:2",
+    "Sheet1!A5:A",
+    "Sheet1!$A$1:$B$2",
+    "'My Sheet'!A1:C",
+    "'Bob''s'!A1",
+    "Sheet1!R1C1:R2C2",
+    "named_range",
+]
+INVALID = ["", "Sheet1!", "Sheet1!A1:B2:C3", "Sheet1!1A", "'unterminated!A1", "S!A1!B2"]
+
+
+@pytest.mark.parametrize("range_a1", VALID)
+def test_valid_ranges_pass(range_a1: str) -> None:
+    assert sheets._invalid_range(range_a1) is None
+    assert sheets._invalid_ranges(range_a1) is None
+
+
+@pytest.mark.parametrize("range_a1", INVALID)
+def test_invalid_ranges_fail(range_a1: str) -> None:
+    assert sheets._invalid_range(range_a1) is not None
+    if range_a1:
+        assert sheets._invalid_ranges(f"A1, {range_a1}") is not None
+
+
+@pytest.mark.parametrize("range_a1", ["'a,b'!A1", "'R&D'!A1", "R&D!A1"])
+def test_range_list_rejects_comma_in_quoted_name(range_a1: str) -> None:
+    assert sheets._invalid_range(range_a1) is None
+    assert sheets._invalid_ranges(range_a1) is not None
+
+
+def test_range_list_allows_whitespace_and_empty_entries() -> None:
+    assert sheets._invalid_ranges(" Sheet1!A1 , B:B,, 'x y'!C3 ") is None
+    assert sheets._ranges_param(" Sheet1!A1 , B:B,, 'x y'!C3 ") == "&ranges=Sheet1!A1&ranges=B:B&ranges='x y'!C3"
+
+
+async def test_invalid_range_short_circuits_dispatch() -> None:
+    ctx = FakeContext()
+    result = await ctx.call(sheets.sheets_get_values, "S", "Sheet1!A1:B2:C3")
+
+    assert ctx.requests == []
+    assert "Invalid A1 range" in json.loads(result[0].text)["error"]
+
+
+# -----------------------------------------------------------------------------
+# Compiled URI helpers
+# -----------------------------------------------------------------------------
+
+# Commas, ASCII and Unicode whitespace, reserved/safe punctuation, and 1/2/4-byte characters.
+_FUZZ_ALPHABET = "aZ09,,  \t\n\x0b\x1c\x85\xa0　!:$'()-._~&%+/?#=é中😀"
+
+
+def _fuzz_inputs(count: int = 2000) -> list[str]:
+    rng = random.Random(0)
+    return ["", ",", " , ", *("".join(rng.choices(_FUZZ_ALPHABET, k=rng.randint(0, 24))) for _ in range(count))]
+
+
+def test_compiled_encode_range_matches_quote() -> None:
+    uri = pytest.importorskip("_uri")
+    for s in _fuzz_inputs():
+        assert uri.encode_range(s) == quote(s, safe="!:$'(),-._~"), s
+
+
+def test_compiled_ranges_param_matches_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    uri = pytest.importorskip("_uri")
+    monkeypatch.setattr(sheets, "_ranges_param_fast", None)
+    for s in _fuzz_inputs():
+        assert uri.ranges_param(s) == sheets._ranges_param(s), s